@@ -10,7 +10,8 @@ setup(
     package_dir={"": "src"},
     install_requires=[
         "streamlit",
-        "pandas"
+        "pandas",
+        "numpy"
     ],
     classifiers=[
         "Programming Language :: Python :: 3",
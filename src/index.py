@@ -1,6 +1,9 @@
+import re
 import streamlit as st
+import numpy as np
 import pandas as pd
-from collections import defaultdict
+from collections import defaultdict, deque
+from parse_driver import ACCEPT, ERROR, REDUCE, SHIFT, parse_tokens
 
 
 class SLRParser:
@@ -11,20 +14,31 @@ class SLRParser:
 
         self.terminals = set()
         self.non_terminals = set()
-        self.first = defaultdict(set)
+        self.first = {}
+        self.nullable = set()
+        self.first_of_suffix = {}
         self.follow = defaultdict(set)
         self.lr0_items = []
         self.states = []
         self.parse_table = {}
+        self.reduce_items = {}
+        self._closure_cache = {}
+        self._closure_of_nt = {}
+        self._state_intern = {}
+        self._item_str = {}
 
         self.start_symbol = list(self.grammar.keys())[0]
 
         self.augment_grammar()
+        self._split_all_prods()
         self._extract_symbols()
         self.compute_first_sets()
+        self.compute_suffix_first_sets()
         self.compute_follow_sets()
         self.construct_lr0_items()
         self.build_slr_parsing_table()
+        self._build_flat_tables()
+        self._compile_tokenizer()
 
     def parse_grammar(self, raw_grammar):
         grammar = defaultdict(list)
@@ -58,11 +72,20 @@ class SLRParser:
         self.grammar[new_start] = [self.start_symbol]
         self.start_symbol = new_start
 
-    def _extract_symbols(self):
+    def _split_all_prods(self):
+        self.prods_split = defaultdict(list)
         for lhs, productions in self.grammar.items():
+            self.prods_split[lhs] = [tuple(p.split()) if p else () for p in productions]
+
+    def _after_dot(self, item):
+        lhs, prod_idx, dot = item
+        return self.prods_split[lhs][prod_idx][dot:]
+
+    def _extract_symbols(self):
+        for lhs, productions in self.prods_split.items():
             self.non_terminals.add(lhs)
-            for production in productions:
-                for symbol in production.split():
+            for symbols in productions:
+                for symbol in symbols:
                     if symbol.isupper():
                         self.non_terminals.add(symbol)
                     else:
@@ -71,114 +94,174 @@ class SLRParser:
         self.terminals.add("$")
 
     def compute_first_sets(self):
-        def first(symbol):
-            if symbol in self.terminals:
-                return {symbol}
-            if self.first[symbol]:
-                return self.first[symbol]
-
-            result = set()
-            for production in self.grammar[symbol]:
-                if production == "":
-                    result.add("ε")
-                else:
-                    for sym in production.split():
-                        if sym == symbol:
-                            break
-                        sym_first = first(sym)
-                        result.update(sym_first - {"ε"})
-                        if "ε" not in sym_first:
-                            break
+        self.prods = [
+            (lhs, symbols)
+            for lhs, productions in self.prods_split.items()
+            for symbols in productions
+        ]
+
+        self.term_bit = {t: 1 << i for i, t in enumerate(sorted(self.terminals))}
+        self.firstbits = defaultdict(int, self.term_bit)
+        if "ε" in self.terminals:
+            self.firstbits["ε"] = 0
+            self.nullable.add("ε")
+
+        sym_to_prods = defaultdict(list)
+        for prod_idx, (lhs, symbols) in enumerate(self.prods):
+            for symbol in set(symbols):
+                sym_to_prods[symbol].append(prod_idx)
+
+        worklist = deque(range(len(self.prods)))
+        while worklist:
+            lhs, symbols = self.prods[worklist.popleft()]
+
+            bits = 0
+            for sym in symbols:
+                bits |= self.firstbits[sym]
+                if sym not in self.nullable:
+                    break
+            else:
+                if lhs not in self.nullable:
+                    self.nullable.add(lhs)
+                    worklist.extend(sym_to_prods[lhs])
+
+            if bits | self.firstbits[lhs] != self.firstbits[lhs]:
+                self.firstbits[lhs] |= bits
+                worklist.extend(sym_to_prods[lhs])
+
+        self.first = {
+            x: self._bits_to_set(self.firstbits[x])
+            for x in self.terminals | self.non_terminals
+        }
+
+    def _bits_to_set(self, bits):
+        return frozenset(t for t, bit in self.term_bit.items() if bits & bit)
+
+    def compute_suffix_first_sets(self):
+        for lhs, productions in self.prods_split.items():
+            for prod_idx, symbols in enumerate(productions):
+                suffix_bits = 0
+                suffix_nullable = True
+                self.first_of_suffix[lhs, prod_idx, len(symbols)] = (
+                    suffix_bits,
+                    suffix_nullable,
+                )
+                for pos in range(len(symbols) - 1, -1, -1):
+                    symbol = symbols[pos]
+                    if symbol in self.nullable:
+                        suffix_bits |= self.firstbits[symbol]
                     else:
-                        result.add("ε")
+                        suffix_bits = self.firstbits[symbol]
+                        suffix_nullable = False
+                    self.first_of_suffix[lhs, prod_idx, pos] = (
+                        suffix_bits,
+                        suffix_nullable,
+                    )
 
-            self.first[symbol] = result
-            return result
+    def compute_follow_sets(self):
+        follow_from_follow = defaultdict(set)
+        followbits = defaultdict(int)
+        followbits[self.start_symbol] = self.term_bit["$"]
+
+        for lhs, productions in self.prods_split.items():
+            for prod_idx, symbols in enumerate(productions):
+                for pos, symbol in enumerate(symbols):
+                    if symbol not in self.non_terminals:
+                        continue
+                    trailer_bits, trailer_nullable = self.first_of_suffix[
+                        lhs, prod_idx, pos + 1
+                    ]
+                    followbits[symbol] |= trailer_bits
+                    if trailer_nullable and symbol != lhs:
+                        follow_from_follow[lhs].add(symbol)
+
+        worklist = deque(self.non_terminals)
+        while worklist:
+            source = worklist.popleft()
+            for target in follow_from_follow[source]:
+                added = followbits[source] & ~followbits[target]
+                if added:
+                    followbits[target] |= added
+                    worklist.append(target)
 
         for nt in self.non_terminals:
-            first(nt)
+            self.follow[nt] = self._bits_to_set(followbits[nt])
 
-    def compute_follow_sets(self):
-        self.follow[self.start_symbol].add("$")
-
-        changed = True
-        while changed:
-            changed = False
-            for lhs, productions in self.grammar.items():
-                for production in productions:
-                    trailer = self.follow[lhs].copy()
-                    for symbol in reversed(production.split()):
-                        if symbol in self.non_terminals:
-                            if trailer - self.follow[symbol]:
-                                self.follow[symbol].update(trailer)
-                                changed = True
-                            if "ε" in self.first[symbol]:
-                                trailer.update(self.first[symbol] - {"ε"})
-                            else:
-                                trailer = self.first[symbol]
-                        else:
-                            trailer = {symbol}
+    def _compute_nt_closures(self):
+        initial_items = {
+            nt: [(nt, prod_idx, 0) for prod_idx in range(len(self.prods_split[nt]))]
+            for nt in self.non_terminals
+        }
+
+        self._closure_of_nt = {}
+        for nt in self.non_terminals:
+            closure_set = set()
+            seen = {nt}
+            worklist = [nt]
+
+            while worklist:
+                current = worklist.pop()
+                closure_set.update(initial_items[current])
+                for symbols in self.prods_split[current]:
+                    if (
+                        symbols
+                        and symbols[0] in self.non_terminals
+                        and symbols[0] not in seen
+                    ):
+                        seen.add(symbols[0])
+                        worklist.append(symbols[0])
+
+            self._closure_of_nt[nt] = frozenset(closure_set)
+
+    def _closure(self, kernel):
+        if kernel in self._closure_cache:
+            return self._closure_cache[kernel]
+
+        closure_set = set(kernel)
+        for item in kernel:
+            after_dot = self._after_dot(item)
+            if after_dot and after_dot[0] in self.non_terminals:
+                closure_set |= self._closure_of_nt[after_dot[0]]
+
+        closure_frozen = frozenset(closure_set)
+        self._closure_cache[kernel] = closure_frozen
+        return closure_frozen
+
+    def _intern_state(self, state):
+        state_index = self._state_intern.get(state)
+        if state_index is None:
+            state_index = len(self.states)
+            self._state_intern[state] = state_index
+            self.states.append(state)
+        return state_index
 
     def construct_lr0_items(self):
-        def closure(items):
-            closure_set = set(items)
-            changed = True
-
-            while changed:
-                changed = False
-                new_items = set(closure_set)
-
-                for lhs, before_dot, after_dot in closure_set:
-                    if after_dot and after_dot[0] in self.non_terminals:
-                        next_symbol = after_dot[0]
-                        for production in self.grammar[next_symbol]:
-                            prod_symbols = production.split() if production else []
-                            new_item = (next_symbol, "", tuple(prod_symbols))
-                            if new_item not in new_items:
-                                new_items.add(new_item)
-                                changed = True
-
-                closure_set = new_items
-            return closure_set
-
-        def goto(state, symbol):
-            new_items = set()
-            for lhs, before_dot, after_dot in state:
-                if after_dot and after_dot[0] == symbol:
-                    new_before_dot = (before_dot + " " + after_dot[0]).strip()
-                    new_after_dot = tuple(after_dot[1:])
-                    new_items.add((lhs, new_before_dot, new_after_dot))
-            return closure(new_items) if new_items else set()
-
-        initial_prod = self.grammar[self.start_symbol][0]
-        initial_symbols = initial_prod.split() if initial_prod else []
-        initial_item = (self.start_symbol, "", tuple(initial_symbols))
-        start_state = closure({initial_item})
-
-        self.states = [start_state]
-        state_map = {frozenset(start_state): 0}
-        state_queue = [start_state]
+        self._compute_nt_closures()
+        start_state = self._closure(frozenset({(self.start_symbol, 0, 0)}))
+        start_index = self._intern_state(start_state)
+        state_queue = deque([start_index])
 
         while state_queue:
-            current_state = state_queue.pop(0)
-            state_index = state_map[frozenset(current_state)]
+            state_index = state_queue.popleft()
+            current_state = self.states[state_index]
 
             self.parse_table[state_index] = {"action": {}, "goto": {}}
 
-            for symbol in self.terminals | self.non_terminals:
-                next_state = goto(current_state, symbol)
-
-                if not next_state:
-                    continue
-
-                next_state_frozen = frozenset(next_state)
-
-                if next_state_frozen not in state_map:
-                    state_map[next_state_frozen] = len(self.states)
-                    self.states.append(next_state)
-                    state_queue.append(next_state)
+            buckets = defaultdict(set)
+            reduce_items = []
+            for lhs, prod_idx, dot in current_state:
+                symbols = self.prods_split[lhs][prod_idx]
+                if dot < len(symbols):
+                    buckets[symbols[dot]].add((lhs, prod_idx, dot + 1))
+                else:
+                    reduce_items.append((lhs, prod_idx))
+            self.reduce_items[state_index] = reduce_items
 
-                next_state_index = state_map[next_state_frozen]
+            for symbol, kernel in buckets.items():
+                state_count = len(self.states)
+                next_state_index = self._intern_state(self._closure(frozenset(kernel)))
+                if len(self.states) > state_count:
+                    state_queue.append(next_state_index)
 
                 if symbol in self.terminals:
                     self.parse_table[state_index]["action"][symbol] = (
@@ -191,27 +274,81 @@ class SLRParser:
         self.lr0_items = self.states
 
     def build_slr_parsing_table(self):
-        for state_idx, state in enumerate(self.states):
-            for item in state:
-                lhs, before_dot, after_dot = item
+        for state_idx, reduce_items in self.reduce_items.items():
+            action_row = self.parse_table[state_idx]["action"]
+            for lhs, prod_idx in reduce_items:
+                if lhs == self.start_symbol:
+                    action_row["$"] = ("accept",)
+                    continue
 
-                if not after_dot:
-                    if lhs == self.start_symbol:
-                        self.parse_table[state_idx]["action"]["$"] = ("accept",)
-                    else:
-                        prod_idx = -1
-                        for idx, prod in enumerate(self.grammar[lhs]):
-                            if " ".join(before_dot.split()) == prod:
-                                prod_idx = idx
-                                break
-
-                        for symbol in self.follow[lhs]:
-                            if symbol not in self.parse_table[state_idx]["action"]:
-                                self.parse_table[state_idx]["action"][symbol] = (
-                                    "reduce",
-                                    lhs,
-                                    prod_idx,
-                                )
+                reduce_action = ("reduce", lhs, prod_idx)
+                for symbol in self.follow[lhs]:
+                    if symbol not in action_row:
+                        action_row[symbol] = reduce_action
+
+    def _build_flat_tables(self):
+        self.term_id = {t: i for i, t in enumerate(sorted(self.terminals))}
+        self.nt_id = {nt: i for i, nt in enumerate(sorted(self.non_terminals))}
+
+        self.prod_refs = []
+        rhs_len = []
+        lhs_id = []
+        for lhs, productions in self.prods_split.items():
+            for prod_idx, symbols in enumerate(productions):
+                self.prod_refs.append((lhs, prod_idx))
+                rhs_len.append(len(symbols))
+                lhs_id.append(self.nt_id[lhs])
+        prod_id = {ref: i for i, ref in enumerate(self.prod_refs)}
+        self.rhs_len = np.array(rhs_len, dtype=np.int32)
+        self.lhs_id = np.array(lhs_id, dtype=np.int32)
+
+        n_states = len(self.states)
+        self.action_kind = np.full((n_states, len(self.term_id)), ERROR, np.int8)
+        self.action_arg = np.full((n_states, len(self.term_id)), -1, np.int32)
+        self.goto_tbl = np.full((n_states, len(self.nt_id)), -1, np.int32)
+
+        for state_idx, entry in self.parse_table.items():
+            for symbol, action in entry["action"].items():
+                tid = self.term_id[symbol]
+                if action[0] == "shift":
+                    self.action_kind[state_idx, tid] = SHIFT
+                    self.action_arg[state_idx, tid] = action[1]
+                elif action[0] == "reduce":
+                    self.action_kind[state_idx, tid] = REDUCE
+                    self.action_arg[state_idx, tid] = prod_id[action[1], action[2]]
+                elif action[0] == "accept":
+                    self.action_kind[state_idx, tid] = ACCEPT
+            for symbol, next_state in entry["goto"].items():
+                self.goto_tbl[state_idx, self.nt_id[symbol]] = next_state
+
+    def _compile_tokenizer(self):
+        terminals = sorted(self.terminals - {"$"}, key=len, reverse=True)
+        if not terminals:
+            self._token_re = re.compile(r"\S+")
+            return
+
+        alternation = "|".join(re.escape(t) for t in terminals)
+        self._token_re = re.compile(f"{alternation}|(?:(?!{alternation})\\S)+")
+
+    def _format_item(self, item):
+        if item in self._item_str:
+            return self._item_str[item]
+
+        lhs, prod_idx, dot = item
+        symbols = self.prods_split[lhs][prod_idx]
+        before_dot = " ".join(symbols[:dot])
+        after_dot = symbols[dot:]
+        if before_dot and after_dot:
+            rhs = f"{before_dot} • {' '.join(after_dot)}"
+        elif before_dot:
+            rhs = f"{before_dot} •"
+        elif after_dot:
+            rhs = f"• {' '.join(after_dot)}"
+        else:
+            rhs = "•"
+
+        self._item_str[item] = f"{lhs} → {rhs}"
+        return self._item_str[item]
 
     def display_parsing_table(self):
         terminals = sorted(list(self.terminals))
@@ -219,35 +356,30 @@ class SLRParser:
             [nt for nt in self.non_terminals if nt != self.start_symbol]
         )
 
-        table_data = []
-
-        for state_idx in range(len(self.states)):
-            row_data = {}
-
-            for term in terminals:
-                if term in self.parse_table[state_idx]["action"]:
-                    action = self.parse_table[state_idx]["action"][term]
-                    if action[0] == "shift":
-                        row_data[term] = f"s{action[1]}"
-                    elif action[0] == "reduce":
-                        row_data[term] = (
-                            f"r({action[1]} → {self.grammar[action[1]][action[2]]})"
-                        )
-                    elif action[0] == "accept":
-                        row_data[term] = "acc"
-                else:
-                    row_data[term] = ""
-
-            for nt in non_terminals:
-                if nt in self.parse_table[state_idx]["goto"]:
-                    row_data[nt] = str(self.parse_table[state_idx]["goto"][nt])
-                else:
-                    row_data[nt] = ""
+        reduce_labels = np.array(
+            [
+                f"r({lhs} → {self.grammar[lhs][prod_idx]})"
+                for lhs, prod_idx in self.prod_refs
+            ]
+        )
+        kind = self.action_kind
+        action_cells = np.select(
+            [kind == SHIFT, kind == REDUCE, kind == ACCEPT],
+            [
+                np.char.add("s", self.action_arg.astype(str)),
+                reduce_labels[np.where(kind == REDUCE, self.action_arg, 0)],
+                "acc",
+            ],
+            "",
+        )
 
-            table_data.append(row_data)
+        goto_cols = self.goto_tbl[:, [self.nt_id[nt] for nt in non_terminals]]
+        goto_cells = np.where(goto_cols >= 0, goto_cols.astype(str), "")
 
         slr_table = pd.DataFrame(
-            table_data, index=[f"I{i}" for i in range(len(self.states))]
+            np.hstack([action_cells, goto_cells]),
+            index=[f"I{i}" for i in range(len(self.states))],
+            columns=terminals + non_terminals,
         )
 
         action_header = pd.DataFrame(
@@ -263,34 +395,50 @@ class SLRParser:
         items_data = []
 
         for i, state in enumerate(self.states):
-            items_str = []
-            for item in state:
-                lhs, before_dot, after_dot = item
-                if before_dot and after_dot:
-                    rhs = f"{before_dot} • {' '.join(after_dot)}"
-                elif before_dot:
-                    rhs = f"{before_dot} •"
-                elif after_dot:
-                    rhs = f"• {' '.join(after_dot)}"
-                else:
-                    rhs = "•"
-                items_str.append(f"{lhs} → {rhs}")
-
-            items_data.append({"State": f"I{i}", "Items": "\n".join(items_str)})
+            items_str = "\n".join(self._format_item(item) for item in state)
+            items_data.append({"State": f"I{i}", "Items": items_str})
 
         items_df = pd.DataFrame(items_data)
         st.dataframe(items_df, use_container_width=True, height=400)
 
-    def parse_string(self, input_string):
-        processed_input = input_string
-        for terminal in sorted(self.terminals - {"$"}, key=len, reverse=True):
-            processed_input = processed_input.replace(terminal, f" {terminal} ")
-
-        tokens = [t for t in processed_input.split() if t]
+    def parse_string(self, input_string, collect_steps=True):
+        tokens = self._token_re.findall(input_string)
         tokens.append("$")
+        token_ids = np.array([self.term_id.get(t, -1) for t in tokens], dtype=np.int32)
+
+        accepted, stalled, token_index, state, failed_prod, steps = parse_tokens(
+            self.action_kind,
+            self.action_arg,
+            self.goto_tbl,
+            self.rhs_len,
+            self.lhs_id,
+            token_ids,
+            collect_steps,
+        )
+
+        if accepted:
+            message = "Input accepted"
+        elif stalled:
+            message = (
+                f"Reductions cycle without consuming input in state {state}; "
+                "the grammar has a cyclic derivation"
+            )
+        elif token_index >= len(tokens):
+            message = f"Unexpected end of input in state {state}"
+        elif failed_prod < 0:
+            message = (
+                f"No action defined for token '{tokens[token_index]}' in state {state}"
+            )
+        else:
+            lhs = self.prod_refs[failed_prod][0]
+            message = f"No goto defined for {lhs} from state {state}"
+
+        if not collect_steps:
+            return accepted, message
 
         stack = [0]
         token_index = 0
+        rhs_len = self.rhs_len.tolist()
 
         parse_steps = []
         parse_steps.append(
@@ -303,33 +451,11 @@ class SLRParser:
             }
         )
 
-        step_counter = 1
-
-        while True:
-            current_state = stack[-1]
-            current_token = tokens[token_index]
-
-            if current_token not in self.parse_table[current_state]["action"]:
-                error_msg = f"No action defined for token '{current_token}' in state {current_state}"
-                parse_steps.append(
-                    {
-                        "Step": step_counter,
-                        "Action": "ERROR",
-                        "Stack": str(stack),
-                        "Input": " ".join(tokens[token_index:]),
-                        "Details": error_msg,
-                    }
-                )
-
-                steps_df = pd.DataFrame(parse_steps)
-                st.table(steps_df)
-                return False, error_msg
-
-            action = self.parse_table[current_state]["action"][current_token]
-
-            if action[0] == "shift":
+        for step_counter, (kind, arg, next_state) in enumerate(steps.tolist(), start=1):
+            if kind == SHIFT:
+                current_token = tokens[token_index]
                 stack.append(current_token)
-                stack.append(action[1])
+                stack.append(next_state)
                 token_index += 1
 
                 parse_steps.append(
@@ -338,46 +464,17 @@ class SLRParser:
                         "Action": f"Shift {current_token}",
                         "Stack": str(stack),
                         "Input": " ".join(tokens[token_index:]),
-                        "Details": f"Move to state {action[1]}",
+                        "Details": f"Move to state {next_state}",
                     }
                 )
 
-            elif action[0] == "reduce":
-                lhs, prod_idx = action[1], action[2]
+            elif kind == REDUCE:
+                lhs, prod_idx = self.prod_refs[arg]
                 production = self.grammar[lhs][prod_idx]
 
-                if production == "":
-                    rhs_len = 0
-                else:
-                    rhs_len = len(production.split())
-
-                old_stack = stack.copy()
-
-                for _ in range(rhs_len * 2):
-                    stack.pop()
-
-                top_state = stack[-1]
-
+                del stack[len(stack) - rhs_len[arg] * 2 :]
                 stack.append(lhs)
-
-                if lhs not in self.parse_table[top_state]["goto"]:
-                    error_msg = f"No goto defined for {lhs} from state {top_state}"
-                    parse_steps.append(
-                        {
-                            "Step": step_counter,
-                            "Action": "ERROR",
-                            "Stack": str(stack),
-                            "Input": " ".join(tokens[token_index:]),
-                            "Details": error_msg,
-                        }
-                    )
-
-                    steps_df = pd.DataFrame(parse_steps)
-                    st.table(steps_df)
-                    return False, error_msg
-
-                goto_state = self.parse_table[top_state]["goto"][lhs]
-                stack.append(goto_state)
+                stack.append(next_state)
 
                 parse_steps.append(
                     {
@@ -385,11 +482,11 @@ class SLRParser:
                         "Action": f"Reduce by {lhs} → {production}",
                         "Stack": str(stack),
                         "Input": " ".join(tokens[token_index:]),
-                        "Details": f"Pop {rhs_len} symbols, push {lhs}, goto state {goto_state}",
+                        "Details": f"Pop {rhs_len[arg]} symbols, push {lhs}, goto state {next_state}",
                     }
                 )
 
-            elif action[0] == "accept":
+            elif kind == ACCEPT:
                 parse_steps.append(
                     {
                         "Step": step_counter,
@@ -400,27 +497,28 @@ class SLRParser:
                     }
                 )
 
-                steps_df = pd.DataFrame(parse_steps)
-                st.table(steps_df)
-                return True, "Input accepted"
-
             else:
-                error_msg = f"Invalid action: {action}"
+                if failed_prod >= 0:
+                    del stack[len(stack) - rhs_len[failed_prod] * 2 :]
+                    stack.append(self.prod_refs[failed_prod][0])
+
                 parse_steps.append(
                     {
                         "Step": step_counter,
                         "Action": "ERROR",
                         "Stack": str(stack),
                         "Input": " ".join(tokens[token_index:]),
-                        "Details": error_msg,
+                        "Details": message,
                     }
                 )
 
-                steps_df = pd.DataFrame(parse_steps)
-                st.table(steps_df)
-                return False, error_msg
+        st.table(pd.DataFrame(parse_steps))
+        return accepted, message
+
 
-            step_counter += 1
+@st.cache_resource(max_entries=32)
+def build_parser(grammar_input):
+    return SLRParser(grammar_input)
 
 
 st.title("SLR Parser")
@@ -432,14 +530,18 @@ input_string = st.text_input("Enter String to Parse:")
 if st.button("Compute FIRST, FOLLOW & Parsing Table"):
     if grammar_input:
         try:
-            parser = SLRParser(grammar_input)
+            parser = build_parser(grammar_input)
             st.subheader("FIRST Sets")
             for nt, first_set in parser.first.items():
-                st.write(f"FIRST({nt}) = {first_set}")
+                if nt not in parser.non_terminals:
+                    continue
+                if nt in parser.nullable:
+                    first_set = first_set | {"ε"}
+                st.write(f"FIRST({nt}) = {set(first_set)}")
 
             st.subheader("FOLLOW Sets")
             for nt, follow_set in parser.follow.items():
-                st.write(f"FOLLOW({nt}) = {follow_set}")
+                st.write(f"FOLLOW({nt}) = {set(follow_set)}")
 
             parser.display_parsing_table()
 
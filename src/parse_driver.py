@@ -0,0 +1,111 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+ERROR, SHIFT, REDUCE, ACCEPT = -1, 0, 1, 2
+
+
+@njit(cache=True)
+def _grow(arr):
+    grown = np.empty(arr.shape[0] * 2, arr.dtype)
+    grown[: arr.shape[0]] = arr
+    return grown
+
+
+@njit(cache=True)
+def parse_tokens(
+    action_kind, action_arg, goto_tbl, rhs_len, lhs_id, tokens, record_steps
+):
+    stack = np.empty(len(tokens) * 2 + 4, np.int32)
+    capacity = len(tokens) * 2 + 4 if record_steps else 1
+    step_kind = np.empty(capacity, np.int32)
+    step_arg = np.empty(capacity, np.int32)
+    step_state = np.empty(capacity, np.int32)
+    stack[0] = 0
+    sp = 0
+    n_steps = 0
+    token_index = 0
+    accepted = False
+    stalled = False
+    failed_prod = -1
+    low = 0
+    reductions = 0
+
+    while True:
+        state = stack[sp]
+        token_id = -1
+        if token_index < tokens.shape[0]:
+            token_id = tokens[token_index]
+        kind = ERROR
+        arg = -1
+        if token_id >= 0:
+            kind = action_kind[state, token_id]
+            arg = action_arg[state, token_id]
+
+        next_state = -1
+        if kind == SHIFT:
+            if sp + 1 == stack.shape[0]:
+                stack = _grow(stack)
+            sp += 1
+            stack[sp] = arg
+            next_state = arg
+        elif kind == REDUCE:
+            # Reductions that pop below every height seen since the last
+            # shift make progress (right-recursive unwinding does this once
+            # per level); anything else is only bounded by the table size,
+            # so a unit or epsilon cycle stops instead of spinning forever.
+            if sp - rhs_len[arg] < low:
+                low = sp - rhs_len[arg]
+                reductions = 0
+            else:
+                reductions += 1
+            if reductions > goto_tbl.size:
+                kind = ERROR
+                stalled = True
+
+        if kind == REDUCE:
+            sp -= rhs_len[arg]
+            state = stack[sp]
+            next_state = goto_tbl[state, lhs_id[arg]]
+            if next_state < 0:
+                kind = ERROR
+                failed_prod = arg
+            else:
+                if sp + 1 == stack.shape[0]:
+                    stack = _grow(stack)
+                sp += 1
+                stack[sp] = next_state
+
+        if record_steps:
+            if n_steps == step_kind.shape[0]:
+                step_kind = _grow(step_kind)
+                step_arg = _grow(step_arg)
+                step_state = _grow(step_state)
+            step_kind[n_steps] = kind
+            step_arg[n_steps] = arg
+            step_state[n_steps] = next_state
+            n_steps += 1
+
+        if kind == SHIFT:
+            token_index += 1
+            low = sp
+            reductions = 0
+        elif kind == ACCEPT:
+            accepted = True
+            break
+        elif kind == ERROR:
+            break
+
+    steps = np.empty((n_steps, 3), np.int32)
+    steps[:, 0] = step_kind[:n_steps]
+    steps[:, 1] = step_arg[:n_steps]
+    steps[:, 2] = step_state[:n_steps]
+    return accepted, stalled, token_index, state, failed_prod, steps
@@ -0,0 +1,38 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from index import SLRParser
+
+
+def test_long_right_recursive_input_is_accepted():
+    parser = SLRParser("S -> a S | a")
+    for collect_steps in (False, True):
+        assert parser.parse_string("a" * 200, collect_steps=collect_steps) == (
+            True,
+            "Input accepted",
+        )
+
+
+def test_long_nested_epsilon_input_is_accepted():
+    parser = SLRParser("S -> ( S ) S | ")
+    assert parser.parse_string("()" * 50, collect_steps=False)[0]
+    assert parser.parse_string("(" * 50 + ")" * 50, collect_steps=False)[0]
+
+
+def test_cyclic_grammar_terminates():
+    # Conflict resolution on this grammar follows set iteration order, so
+    # the table may accept "a"; it must never loop on the A -> B -> A cycle.
+    parser = SLRParser("S -> A ; A -> B | a ; B -> A")
+    for collect_steps in (False, True):
+        accepted, message = parser.parse_string("a", collect_steps=collect_steps)
+        assert accepted or message.startswith("Reductions cycle")
+
+
+def test_dollar_terminal_stops_at_end_of_input():
+    parser = SLRParser("S -> a $")
+    assert parser.parse_string("a", collect_steps=False) == (
+        False,
+        "Unexpected end of input in state 3",
+    )